@@ -0,0 +1,49 @@
+"""Store vehicle_type as a CHECK-constrained string instead of an ENUM
+
+Revision ID: 2c6d8e0f4b71
+Revises: f1a7c3e9d254
+Create Date: 2026-10-14 14:31:45.208136
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '2c6d8e0f4b71'
+down_revision: Union[str, Sequence[str], None] = 'f1a7c3e9d254'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column(
+        'vehicle_listings',
+        'vehicle_type',
+        existing_type=sa.Enum('car', 'bike', name='vehicletypeenum'),
+        type_=sa.String(length=8),
+        existing_nullable=True,
+        postgresql_using='vehicle_type::text'
+    )
+    op.create_check_constraint(
+        'ck_vehicle_listings_vehicle_type',
+        'vehicle_listings',
+        "vehicle_type IN ('car', 'bike')"
+    )
+    op.execute("DROP TYPE vehicletypeenum")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("CREATE TYPE vehicletypeenum AS ENUM ('car', 'bike')")
+    op.drop_constraint('ck_vehicle_listings_vehicle_type', 'vehicle_listings', type_='check')
+    op.alter_column(
+        'vehicle_listings',
+        'vehicle_type',
+        existing_type=sa.String(length=8),
+        type_=sa.Enum('car', 'bike', name='vehicletypeenum'),
+        existing_nullable=True,
+        postgresql_using='vehicle_type::vehicletypeenum'
+    )
@@ -0,0 +1,41 @@
+"""Add partial indexes on active vehicle listings
+
+Revision ID: 3f9c2a7d51e4
+Revises: e0c31b90a81b
+Create Date: 2026-10-14 10:02:11.418203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2a7d51e4'
+down_revision: Union[str, Sequence[str], None] = 'e0c31b90a81b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'listings_active_user',
+        'vehicle_listings',
+        ['user_id', sa.text('created_at DESC')],
+        unique=False,
+        postgresql_where=sa.text('is_active = true')
+    )
+    op.create_index(
+        'listings_active_id',
+        'vehicle_listings',
+        ['id'],
+        unique=False,
+        postgresql_where=sa.text('is_active = true')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('listings_active_id', table_name='vehicle_listings')
+    op.drop_index('listings_active_user', table_name='vehicle_listings')
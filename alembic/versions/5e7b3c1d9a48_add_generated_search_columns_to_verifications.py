@@ -0,0 +1,82 @@
+"""Add generated search columns to vehicle_verifications
+
+Revision ID: 5e7b3c1d9a48
+Revises: 9d4a6b2e8f13
+Create Date: 2026-10-14 12:58:40.116392
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5e7b3c1d9a48'
+down_revision: Union[str, Sequence[str], None] = '9d4a6b2e8f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.add_column(
+        'vehicle_verifications',
+        sa.Column(
+            'manufacturer_lc',
+            sa.String(),
+            sa.Computed("lower(trim(raw_data->>'vehicle_manufacturer_name'))", persisted=True)
+        )
+    )
+    op.add_column(
+        'vehicle_verifications',
+        sa.Column(
+            'model_lc',
+            sa.String(),
+            sa.Computed("lower(trim(raw_data->>'model'))", persisted=True)
+        )
+    )
+    op.add_column(
+        'vehicle_verifications',
+        sa.Column(
+            'reg_year',
+            sa.Integer(),
+            sa.Computed(
+                "CASE WHEN raw_data->>'reg_date' ~ '^[0-9]{4}' "
+                "THEN substring(raw_data->>'reg_date', 1, 4)::integer END",
+                persisted=True
+            )
+        )
+    )
+    op.create_index(
+        'ix_vehicle_verifications_manufacturer_lc_trgm',
+        'vehicle_verifications',
+        ['manufacturer_lc'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'manufacturer_lc': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_vehicle_verifications_model_lc_trgm',
+        'vehicle_verifications',
+        ['model_lc'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'model_lc': 'gin_trgm_ops'}
+    )
+    op.create_index(
+        'ix_vehicle_verifications_reg_year',
+        'vehicle_verifications',
+        ['reg_year'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vehicle_verifications_reg_year', table_name='vehicle_verifications')
+    op.drop_index('ix_vehicle_verifications_model_lc_trgm', table_name='vehicle_verifications')
+    op.drop_index('ix_vehicle_verifications_manufacturer_lc_trgm', table_name='vehicle_verifications')
+    op.drop_column('vehicle_verifications', 'reg_year')
+    op.drop_column('vehicle_verifications', 'model_lc')
+    op.drop_column('vehicle_verifications', 'manufacturer_lc')
@@ -0,0 +1,40 @@
+"""Add active boost lookup indexes
+
+Revision ID: 7b1e0d4c9a26
+Revises: 3f9c2a7d51e4
+Create Date: 2026-10-14 10:41:37.902315
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7b1e0d4c9a26'
+down_revision: Union[str, Sequence[str], None] = '3f9c2a7d51e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_user_boosts_listing_period',
+        'user_boosts',
+        ['listing_id', 'end_date', 'start_date'],
+        unique=False
+    )
+    op.create_index(
+        'ix_user_boosts_bundle_period',
+        'user_boosts',
+        ['user_id', 'end_date', 'start_date'],
+        unique=False,
+        postgresql_where=sa.text('listing_id IS NULL')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_user_boosts_bundle_period', table_name='user_boosts')
+    op.drop_index('ix_user_boosts_listing_period', table_name='user_boosts')
@@ -0,0 +1,32 @@
+"""Add listing_images (listing_id, is_primary) index
+
+Revision ID: 9d4a6b2e8f13
+Revises: c52e8f7a3b90
+Create Date: 2026-10-14 12:21:05.337816
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9d4a6b2e8f13'
+down_revision: Union[str, Sequence[str], None] = 'c52e8f7a3b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_listing_images_listing_primary',
+        'listing_images',
+        ['listing_id', 'is_primary'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_listing_images_listing_primary', table_name='listing_images')
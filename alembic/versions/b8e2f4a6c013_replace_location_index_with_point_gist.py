@@ -0,0 +1,42 @@
+"""Replace btree_gist lat/lng index with a GiST point index
+
+Revision ID: b8e2f4a6c013
+Revises: 5e7b3c1d9a48
+Create Date: 2026-10-14 13:24:18.530961
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e2f4a6c013'
+down_revision: Union[str, Sequence[str], None] = '5e7b3c1d9a48'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_vehicle_listings_location_point',
+        'vehicle_listings',
+        [sa.text('point(longitude, latitude)')],
+        unique=False,
+        postgresql_using='gist',
+        postgresql_where=sa.text('is_active = true')
+    )
+    op.drop_index('idx_vehicle_listings_location', table_name='vehicle_listings')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        'idx_vehicle_listings_location',
+        'vehicle_listings',
+        ['latitude', 'longitude'],
+        unique=False,
+        postgresql_using='gist'
+    )
+    op.drop_index('ix_vehicle_listings_location_point', table_name='vehicle_listings')
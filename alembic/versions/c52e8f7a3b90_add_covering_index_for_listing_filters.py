@@ -0,0 +1,36 @@
+"""Add covering index for listing feed filters
+
+Revision ID: c52e8f7a3b90
+Revises: 7b1e0d4c9a26
+Create Date: 2026-10-14 11:47:36.902514
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'c52e8f7a3b90'
+down_revision: Union[str, Sequence[str], None] = '7b1e0d4c9a26'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'listings_filter_cover',
+        'vehicle_listings',
+        ['vehicle_type', 'price', 'kilometers_driven'],
+        unique=False,
+        postgresql_include=[
+            'id', 'user_id', 'reg_no', 'latitude', 'longitude', 'created_at'
+        ],
+        postgresql_where=sa.text('is_active = true')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('listings_filter_cover', table_name='vehicle_listings')
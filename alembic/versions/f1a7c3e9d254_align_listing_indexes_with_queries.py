@@ -0,0 +1,39 @@
+"""Drop vehicle_type index and index listing views by listing and time
+
+Revision ID: f1a7c3e9d254
+Revises: b8e2f4a6c013
+Create Date: 2026-10-14 13:52:07.671349
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'f1a7c3e9d254'
+down_revision: Union[str, Sequence[str], None] = 'b8e2f4a6c013'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index('ix_vehicle_listings_vehicle_type', table_name='vehicle_listings')
+    op.create_index(
+        'ix_listing_views_listing_timestamp',
+        'listing_views',
+        ['listing_id', 'timestamp'],
+        unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_listing_views_listing_timestamp', table_name='listing_views')
+    op.create_index(
+        'ix_vehicle_listings_vehicle_type',
+        'vehicle_listings',
+        ['vehicle_type'],
+        unique=False
+    )
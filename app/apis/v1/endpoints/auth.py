@@ -1,5 +1,6 @@
 # backend/app/apis/v1/endpoints/auth.py
 from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from typing import Any
@@ -8,7 +9,7 @@ from app import crud, schemas, models
 from app.database import get_db
 from app.core.security import create_access_token, verify_password, verify_email_verification_token
 from app.helper.email import send_verification_email, send_password_reset_email
-from app.core.redis import is_email_resend_throttled
+from app.core.redis import is_email_resend_throttled, invalidate_cached_user
 from app.core.security import create_password_reset_token, verify_password_reset_token, get_password_hash
 from app.dependencies import get_current_user
 from app.core.google_auth import verify_google_token
@@ -22,13 +23,13 @@ async def register_user(user_in: schemas.UserCreate, db: Session = Depends(get_d
     """
     Create new user and send email verification link.
     """
-    db_user = crud.get_user_by_email(db, email=user_in.email)
-    if db_user:
+    if crud.user_exists_by_email(db, email=user_in.email):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Email already registered",
         )
-    user = crud.create_user(db=db, user=user_in)
+    # bcrypt hashing is CPU-bound; keep it off the event loop
+    user = await run_in_threadpool(crud.create_user, db=db, user=user_in)
     await send_verification_email(user.email)
     return user
 
@@ -134,6 +135,7 @@ def verify_email(token: str, db: Session = Depends(get_db)) -> Any:
     db.add(user)
     db.commit()
     db.refresh(user)
+    invalidate_cached_user(user.email)
 
     return user
 
@@ -174,9 +176,8 @@ async def forgot_password(
     Request a password reset link for the given email.
     """
     # Always return a generic success message to prevent email enumeration
-    user = crud.get_user_by_email(db, email=request.email)
-    if user:
-        await send_password_reset_email(user.email)
+    if crud.user_exists_by_email(db, email=request.email):
+        await send_password_reset_email(request.email)
 
     return {"message": "If a user with that email exists, a password reset link will be sent."}
 
@@ -203,7 +204,7 @@ async def reset_password(
             detail="User not found.",
         )
 
-    user.hashed_password = get_password_hash(request.new_password)
+    user.hashed_password = await run_in_threadpool(get_password_hash, request.new_password)
     db.add(user)
     db.commit()
     db.refresh(user)
@@ -220,13 +221,13 @@ async def change_password(
     """
     Change the password for the authenticated user.
     """
-    if not verify_password(request.current_password, current_user.hashed_password):
+    if not await run_in_threadpool(verify_password, request.current_password, current_user.hashed_password):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Incorrect current password.",
         )
 
-    current_user.hashed_password = get_password_hash(request.new_password)
+    current_user.hashed_password = await run_in_threadpool(get_password_hash, request.new_password)
     db.add(current_user)
     db.commit()
     db.refresh(current_user)
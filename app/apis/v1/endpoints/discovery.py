@@ -1,5 +1,5 @@
 # backend/app/apis/v1/endpoints/discovery.py
-from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form
+from fastapi import APIRouter, Depends, HTTPException, status, File, UploadFile, Form, Response
 from sqlalchemy.orm import Session
 from typing import List, Any, Optional
 
@@ -25,7 +25,10 @@ def homepage_listings(lat: float, lng: float, db: Session = Depends(get_db)):
         listing.distance = distance
         listing.is_boosted = is_boosted
         results.append(listing)
-    return results
+
+    body = schemas.VehicleListingListAdapter.dump_json(
+        schemas.VehicleListingListAdapter.validate_python(results, from_attributes=True))
+    return Response(content=body, media_type="application/json")
 
 def boosted(): pass
 
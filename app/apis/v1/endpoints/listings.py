@@ -1,8 +1,9 @@
 from typing import List, Optional, Any
+from datetime import datetime
 
 from fastapi import (
     APIRouter, Depends, HTTPException, status,
-    File, UploadFile, Form, BackgroundTasks
+    File, UploadFile, Form, BackgroundTasks, Response
 )
 from sqlalchemy.orm import Session
 import cloudinary
@@ -26,6 +27,14 @@ cloudinary.config(
 
 # --- Helper Utilities ---
 
+# Feed summary fields read straight off the listing row; the rest are
+# computed per page in read_listings
+_SUMMARY_ROW_FIELDS = tuple(
+    name for name in schemas.VehicleListingSummary.model_fields
+    if name not in ("primary_image_url", "distance", "is_boosted")
+)
+
+
 def enrich_listing(listing: models.VehicleListing, db: Session):
     listing.rc_details = listing.verification.raw_data if listing.verification else None
     if not listing.owner:
@@ -36,31 +45,59 @@ def enrich_listing(listing: models.VehicleListing, db: Session):
 # --- Endpoints ---
 
 
-@router.get("/my-listings", response_model=List[schemas.VehicleListing])
+@router.get("/my-listings", response_model=schemas.MyListingsPage)
 def get_my_listings(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user),
     skip: int = 0,
     limit: int = 10,
+    after_is_boosted: Optional[bool] = None,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None,
 ):
+    # Pass the previous page's next_cursor as (after_is_boosted,
+    # after_created_at, after_id) to fetch the next page; skip is only used
+    # when no cursor is given
+    cursor = (after_is_boosted, after_created_at, after_id)
+    if any(value is not None for value in cursor) and None in cursor:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="after_is_boosted, after_created_at and after_id must be given together",
+        )
+
     results = []
     listings_with_boost_status = crud.get_user_vehicle_listings(
-        db=db, skip=skip, limit=limit, user_id=current_user.id)
+        db=db, skip=skip, limit=limit, user_id=current_user.id,
+        after_is_boosted=after_is_boosted,
+        after_created_at=after_created_at,
+        after_id=after_id)
     for listing, is_boosted in listings_with_boost_status:
         listing.rc_details = listing.verification.raw_data if listing.verification else None
         listing.owner_email = current_user.email
         listing.is_boosted = is_boosted
         results.append(listing)
-    return results
+
+    # A full page may have more after it; a short one is the last
+    next_cursor = None
+    if results and len(results) == limit:
+        last = results[-1]
+        next_cursor = {
+            "after_is_boosted": last.is_boosted,
+            "after_created_at": last.created_at,
+            "after_id": last.id,
+        }
+    page = schemas.MyListingsPage.model_validate(
+        {"listings": results, "next_cursor": next_cursor}, from_attributes=True)
+    return Response(content=page.model_dump_json(), media_type="application/json")
 
 
 @router.post("/", response_model=schemas.VehicleListing, status_code=status.HTTP_201_CREATED)
-async def create_listing(
+def create_listing(
     listing: schemas.VehicleListingCreate,
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ) -> Any:
-    if crud.get_active_listing_by_rc(db=db, rc=listing.reg_no):
+    if crud.active_listing_exists_by_rc(db=db, rc=listing.reg_no):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="An active listing with the RC already exists.",
@@ -71,7 +108,7 @@ async def create_listing(
     return listing
 
 
-@router.get("/", response_model=List[schemas.VehicleListing])
+@router.get("/", response_model=List[schemas.VehicleListingSummary])
 def read_listings(
     lat: float,
     lng: float,
@@ -79,7 +116,7 @@ def read_listings(
     skip: int = 0,
     limit: int = 10,
     search_q: Optional[str] = None,
-    vehicle_type: Optional[schemas.VehicleTypeEnum] = None,
+    vehicle_type: Optional[schemas.VehicleTypeLiteral] = None,
     min_price: Optional[int] = None,
     max_price: Optional[int] = None,
     min_year: Optional[int] = None,
@@ -102,13 +139,21 @@ def read_listings(
         min_km_driven=min_km_driven,
         max_km_driven=max_km_driven
     )
-    results = []
-    for listing, distance, is_boosted in listings:
-        enrich_listing(listing, db)
-        listing.distance = distance
-        listing.is_boosted = is_boosted
-        results.append(listing)
-    return results
+    # Rows come from our own table and were validated on write, so the
+    # summaries are constructed without re-validating each one
+    results = [
+        schemas.VehicleListingSummary.model_construct(
+            **{name: getattr(listing, name) for name in _SUMMARY_ROW_FIELDS},
+            primary_image_url=next(
+                (image.url for image in listing.images if image.is_primary), None),
+            distance=distance,
+            is_boosted=is_boosted,
+        )
+        for listing, distance, is_boosted in listings
+    ]
+
+    body = schemas.VehicleListingSummaryListAdapter.dump_json(results)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/{listing_id}", response_model=schemas.VehicleListing)
@@ -116,24 +161,33 @@ def read_listing(listing_id: int,
                  background_tasks: BackgroundTasks,
                  db: Session = Depends(get_db),
                  current_user: models.User = Depends(get_current_user_optional)) -> Any:
-    listing = crud.get_listing_by_id(db, listing_id=listing_id)
-    if not listing:
-        raise HTTPException(status_code=404, detail="Listing not found")
+    cached = crud.get_cached_listing(listing_id)
+    if cached:
+        listing = schemas.VehicleListing.model_validate(cached)
+    else:
+        db_listing = crud.get_listing_by_id(db, listing_id=listing_id)
+        if not db_listing:
+            raise HTTPException(status_code=404, detail="Listing not found")
+        enrich_listing(db_listing, db)
+        listing = schemas.VehicleListing.model_validate(db_listing)
+        crud.cache_listing(listing_id, listing.model_dump(mode="json"))
 
     # Add a background task to record the view (iff viewer is not the lister)
     if current_user and listing.user_id != current_user.id:
         background_tasks.add_task(
-            crud.create_listing_view, db, listing_id=listing_id, user_id=current_user.id
+            crud.record_listing_view, listing_id=listing_id, user_id=current_user.id
         )
     if not current_user:
         background_tasks.add_task(
-            crud.create_listing_view, db, listing_id=listing_id, user_id=None
+            crud.record_listing_view, listing_id=listing_id, user_id=None
         )
 
-    enrich_listing(listing, db)
+    # Mask on a copy so the cached entry keeps the real contact details
     if not current_user:
-        listing.owner_email = "please@log.in"
-        listing.seller_phone = "9876543210"
+        listing = listing.model_copy(update={
+            "owner_email": "please@log.in",
+            "seller_phone": "9876543210"
+        })
     return listing
 
 
@@ -143,9 +197,9 @@ def delete_listing_by_id(
     db: Session = Depends(get_db),
     current_user: models.User = Depends(get_current_user)
 ) -> None:
-    listing = crud.delete_listing(
+    deleted = crud.delete_listing(
         db, listing_id=listing_id, user_id=current_user.id)
-    if not listing:
+    if not deleted:
         raise HTTPException(
             status_code=404, detail="Listing not found or not authorized")
 
@@ -220,7 +274,10 @@ async def upload_listing_images(
             "is_primary": is_primary_flags[i]
         })
 
-    return crud.add_listing_images(db, listing_id, image_data)
+    images = crud.add_listing_images(db, listing_id, image_data)
+    body = schemas.ListingImageListAdapter.dump_json(
+        schemas.ListingImageListAdapter.validate_python(images, from_attributes=True))
+    return Response(content=body, media_type="application/json")
 
 
 @router.delete("/images/{image_id}", status_code=204)
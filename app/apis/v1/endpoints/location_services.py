@@ -1,16 +1,21 @@
 from fastapi import APIRouter, HTTPException, Depends
 from app.dependencies import get_current_user
 from app.core.config import settings
-import requests
-import json
+import httpx
+import orjson
 from app import schemas
-from app.helper.locationServices import extract_location_components, filter_relevant_suggestions, get_place_details
+from app.helper.locationServices import extract_location_components, filter_relevant_suggestions, get_place_details, reverse_geocode, http_client
 from app.core.redis import get_redis_client
 
 # router = APIRouter(dependencies=[Depends(get_current_user)])
 router = APIRouter()
 
 CACHE_TTL_SECONDS = 24 * 60 * 60
+REVERSE_GEOCODE_PRECISION = 4
+# Suggestions for a typed prefix; short-lived so new places show up quickly
+AUTOCOMPLETE_CACHE_TTL_SECONDS = 3 * 60
+# ~110 m grid, well inside the 360 m location bias circle
+AUTOCOMPLETE_BIAS_PRECISION = 3
 
 @router.post("/get-location", response_model=schemas.LocationDetail)
 async def get_location_details(request: schemas.LocationRequest):
@@ -21,53 +26,54 @@ async def get_location_details(request: schemas.LocationRequest):
         cache_key = f"place_details:{request.placeId}"
         cached_data = await redis_client.get(cache_key)
         if cached_data:
-            return schemas.LocationDetail(**json.loads(cached_data))
+            return schemas.LocationDetail(**orjson.loads(cached_data))
         
         try:
-            place_data = get_place_details(request.placeId)
+            place_data = await get_place_details(request.placeId)
+            if place_data is None:
+                raise HTTPException(status_code=404, detail="Place not found.")
             extracted_data = extract_location_components(place_data, source_api="places_details")
-            await redis_client.setex(cache_key, CACHE_TTL_SECONDS, json.dumps(extracted_data))
+            await redis_client.setex(cache_key, CACHE_TTL_SECONDS, orjson.dumps(extracted_data))
             return extracted_data
-        except requests.exceptions.RequestException as e:
-            raise HTTPException(status_code=e.response.status_code if e.response else 500, detail=f"Google Maps API error: {e}")
+        except httpx.HTTPError as e:
+            status_code = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else 500
+            raise HTTPException(status_code=status_code, detail=f"Google Maps API error: {e}")
 
     elif request.lat and request.lng:
-        lat = request.lat
-        lng = request.lng
+        try:
+            lat = float(request.lat)
+            lng = float(request.lng)
+        except ValueError:
+            raise HTTPException(status_code=400, detail="Invalid lat/lng values.")
+
+        # ~11 m grid: nearby fixes from the same spot share one cache entry
+        lat = round(lat, REVERSE_GEOCODE_PRECISION)
+        lng = round(lng, REVERSE_GEOCODE_PRECISION)
         cache_key = f"reverse_geocode:{lat},{lng}"
         cached_data = await redis_client.get(cache_key)
         if cached_data:
-            return schemas.LocationDetail(**json.loads(cached_data))
+            return schemas.LocationDetail(**orjson.loads(cached_data))
 
-        MAPS_API_KEY = settings.MAPS_API_KEY
-        url = "https://maps.googleapis.com/maps/api/geocode/json"
-        payload = {
-            "latlng": f"{lat},{lng}",
-            "result_type": "sublocality|locality|administrative_area_level_7|administrative_area_level_6|administrative_area_level_5|administrative_area_level_4|administrative_area_level_3|administrative_area_level_2|administrative_area_level_1|country",
-            "key": MAPS_API_KEY
-        }
-        
         try:
-            response = requests.get(url=url, params=payload)
-            response.raise_for_status()
-            data = response.json()
+            data = await reverse_geocode(lat, lng)
 
             if data.get("status") != "OK":
                 raise HTTPException(
                     status_code=400, detail=f"Geocoding Failed: {data.get('status')} - {data.get('error_message', 'No Additional info')}")
 
             extracted_data = extract_location_components(data, source_api="geocode")
-            await redis_client.setex(cache_key, CACHE_TTL_SECONDS, json.dumps(extracted_data))
+            await redis_client.setex(cache_key, CACHE_TTL_SECONDS, orjson.dumps(extracted_data))
             return extracted_data
-        except requests.exceptions.RequestException as e:
-            raise HTTPException(status_code=e.response.status_code if e.response else 500, detail=f"Google Maps API error: {e}")
+        except httpx.HTTPError as e:
+            status_code = e.response.status_code if isinstance(e, httpx.HTTPStatusError) else 500
+            raise HTTPException(status_code=status_code, detail=f"Google Maps API error: {e}")
 
     else:
         raise HTTPException(status_code=400, detail="Either placeId or both lat and lng must be provided.")
 
 
 @router.post("/loc-autocomplete", response_model=schemas.LocAutoCompleteResponse)
-def locAutoComplete(request: schemas.LocAutoCompleteRequest):
+async def locAutoComplete(request: schemas.LocAutoCompleteRequest):
     try:
         payload = {
             "input": request.addrStr
@@ -91,6 +97,7 @@ def locAutoComplete(request: schemas.LocAutoCompleteRequest):
             except ValueError:
                 raise HTTPException(
                     status_code=400, detail="Invalid latlng format. Use 'lat,lng'.")
+            bias = f"{round(lat, AUTOCOMPLETE_BIAS_PRECISION)},{round(lng, AUTOCOMPLETE_BIAS_PRECISION)}"
         else:
             # Restrict suggestions to India when latLng not provided
             payload["locationRestriction"] = {
@@ -101,13 +108,22 @@ def locAutoComplete(request: schemas.LocAutoCompleteRequest):
                     "high": {"latitude": 35.6745457, "longitude": 97.395561}
                 }
             }
+            bias = "in"
+
+        # Same prefix from the same area -> same suggestions; the session
+        # token only groups billing, so it stays out of the key
+        redis_client = await get_redis_client()
+        cache_key = f"places:ac:{' '.join(request.addrStr.lower().split())}:{bias}"
+        cached_data = await redis_client.get(cache_key)
+        if cached_data:
+            return {"suggestions": orjson.loads(cached_data)}
 
         headers = {
             "Content-Type": "application/json",
             "X-Goog-Api-Key": settings.MAPS_API_KEY
         }
 
-        response = requests.post(
+        response = await http_client.post(
             "https://places.googleapis.com/v1/places:autocomplete",
             json=payload,
             headers=headers
@@ -118,8 +134,10 @@ def locAutoComplete(request: schemas.LocAutoCompleteRequest):
                 status_code=response.status_code,
                 detail=f"Google API Error: {response.text}"
             )
-        data = response.json()
-        return {"suggestions": filter_relevant_suggestions(data.get('suggestions', []))}
+        data = orjson.loads(response.content)
+        suggestions = filter_relevant_suggestions(data.get('suggestions', []))
+        await redis_client.setex(cache_key, AUTOCOMPLETE_CACHE_TTL_SECONDS, orjson.dumps(suggestions))
+        return {"suggestions": suggestions}
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
@@ -4,9 +4,9 @@ from app import schemas, models, crud
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.core.config import settings
+from app.core.redis import sync_redis_client as redis_client
 import requests
 import uuid
-import redis
 from datetime import datetime, timedelta, timezone
 
 router = APIRouter()
@@ -15,9 +15,7 @@ router = APIRouter()
 @router.post("/vehicle-verify", response_model=schemas.VehicleVerificationResponse)
 def verify_vehicle_rc(request: schemas.RCRequest, db: Session = Depends(get_db), current_user: models.User = Depends(get_current_user)):
     # Check if already in DB
-    request.reg_no = request.reg_no.upper()
-    existing_listing = crud.get_active_listing_by_rc(db, request.reg_no)
-    if existing_listing:
+    if crud.active_listing_exists_by_rc(db, request.reg_no):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="An active listing with this RC already exists. If you created it, please check under 'My Listings'.",
@@ -30,7 +28,6 @@ def verify_vehicle_rc(request: schemas.RCRequest, db: Session = Depends(get_db),
             data=existing.raw_data
         )
     # Rate limiting logic
-    redis_client = redis.from_url(settings.REDIS_URL)
     rate_limit_key = f"rate_limit:vehicle_verify:{current_user.id}"
 
     pipe = redis_client.pipeline()
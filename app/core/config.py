@@ -16,6 +16,7 @@ class Settings(BaseSettings):
     PROJECT_NAME: str = Field("MotoG API", env="PROJECT_NAME")
     API_V1_STR: str = Field(env="API_V1_STR")
     ENV: str = Field("nonprod", env="ENV")
+    LOG_LEVEL: str = Field("INFO", env="LOG_LEVEL")
     FRONTEND_SERVER_HOST: str = Field("http://localhost:8000", env="FRONTEND_SERVER_HOST")
 
     # Database Settings
@@ -44,6 +45,7 @@ class Settings(BaseSettings):
 
     # Redis URL (with a default for local development)
     REDIS_URL: str = Field("redis://localhost:6379/0", env="REDIS_URL")
+    REDIS_MAX_CONNECTIONS: int = Field(32, env="REDIS_MAX_CONNECTIONS")
     
     CASHFREE_API_URL: Optional[str] = Field(None, env="CASHFREE_API_URL")
     CASHFREE_CLIENT_ID: Optional[str] = Field(None, env="CASHFREE_CLIENT_ID")
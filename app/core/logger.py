@@ -0,0 +1,26 @@
+# app/core/logger.py
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+
+from app.core.config import settings
+
+# Records from the "app" loggers are put on a queue by the calling thread and
+# written to stderr by the listener's background thread, so a slow stdout
+# pipe never blocks a request
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+
+_stream_handler = logging.StreamHandler()
+_stream_handler.setFormatter(
+    logging.Formatter("%(asctime)s %(levelname)s %(name)s: %(message)s")
+)
+
+log_listener = QueueListener(_log_queue, _stream_handler)
+
+def setup_logging():
+    app_logger = logging.getLogger("app")
+    app_logger.setLevel(settings.LOG_LEVEL)
+    app_logger.addHandler(QueueHandler(_log_queue))
+    # uvicorn owns the root logger; don't emit our records twice
+    app_logger.propagate = False
+    log_listener.start()
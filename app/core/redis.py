@@ -1,13 +1,35 @@
 # app/core/redis.py
-from redis.asyncio import Redis
+import json
+import logging
+from typing import Optional
+
+import redis
+from redis.asyncio import Redis, BlockingConnectionPool
 from app.core.config import settings
 
+log = logging.getLogger(__name__)
+
+# Shared pool for the sync (threadpool) code paths. BlockingConnectionPool
+# waits for a free connection instead of opening unbounded new ones.
+sync_redis_client = redis.Redis(
+    connection_pool=redis.BlockingConnectionPool.from_url(
+        settings.REDIS_URL,
+        max_connections=settings.REDIS_MAX_CONNECTIONS,
+        decode_responses=True,
+    )
+)
+
 redis_client: Redis = None
 
 async def get_redis_client() -> Redis:
     global redis_client
     if redis_client is None:
-        redis_client = Redis.from_url(settings.REDIS_URL)
+        redis_client = Redis(
+            connection_pool=BlockingConnectionPool.from_url(
+                settings.REDIS_URL,
+                max_connections=settings.REDIS_MAX_CONNECTIONS,
+            )
+        )
     return redis_client
 
 async def is_email_resend_throttled(email: str) -> bool:
@@ -23,3 +45,34 @@ async def is_email_resend_throttled(email: str) -> bool:
     
     # If setnx returned 0, it means the key already existed, so it's throttled
     return results[0] == 0
+
+USER_CACHE_TTL_SECONDS = 10 * 60
+
+def _user_cache_key(email: str) -> str:
+    return f"user:{email}"
+
+# The user cache fails open: Redis errors are logged and treated as a miss,
+# so auth falls back to the users table instead of failing the request
+
+async def get_cached_user(email: str) -> Optional[dict]:
+    client = await get_redis_client()
+    try:
+        cached = await client.get(_user_cache_key(email))
+    except redis.RedisError:
+        log.warning("User cache read failed", exc_info=True)
+        return None
+    return json.loads(cached) if cached else None
+
+async def cache_user(email: str, data: dict):
+    client = await get_redis_client()
+    try:
+        await client.setex(_user_cache_key(email), USER_CACHE_TTL_SECONDS, json.dumps(data))
+    except redis.RedisError:
+        log.warning("User cache write failed", exc_info=True)
+
+def invalidate_cached_user(email: str):
+    # Sync pool: called from sync (threadpool) routes after they commit
+    try:
+        sync_redis_client.delete(_user_cache_key(email))
+    except redis.RedisError:
+        log.warning("User cache invalidation failed", exc_info=True)
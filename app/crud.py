@@ -2,38 +2,147 @@
 
 import re
 import json
+import logging
 import math
 from typing import Optional, List
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 
-import googlemaps
-import redis
-from sqlalchemy import func, or_, and_, cast, Integer, bindparam, case, exists
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, or_, and_, bindparam, DateTime, case, exists, update, insert, tuple_
+from sqlalchemy.orm import Session, joinedload, selectinload, contains_eager
 from fastapi import HTTPException
+from redis.exceptions import RedisError
 
 from . import models, schemas
-from .core.config import settings
 from .core.security import get_password_hash
+from .core.redis import sync_redis_client as redis_client
+
+log = logging.getLogger(__name__)
+
+LISTING_CACHE_TTL_SECONDS = 300
+# Listing views are queued here and written to listing_views in batches
+LISTING_VIEWS_BUFFER_KEY = "listing_views:buffer"
+LISTING_VIEWS_FLUSH_BATCH_SIZE = 1000
+
+# Strips everything except letters, digits and whitespace from search queries
+_KW_STRIP = re.compile(r"[^a-zA-Z0-9\s]")
+
+# Listing feed expressions are built once at import; the caller's position
+# and the current time are bound per execution via .params(lat=, lng=, now=)
+_NOW = bindparam('now', type_=DateTime(timezone=True))
+
+_HAVERSINE_KM = 6371 * func.acos(
+    func.greatest(-1.0, func.least(1.0,
+        func.cos(func.radians(bindparam('lat'))) *
+        func.cos(func.radians(models.VehicleListing.latitude)) *
+        func.cos(func.radians(models.VehicleListing.longitude) - func.radians(bindparam('lng'))) +
+        func.sin(func.radians(bindparam('lat'))) *
+        func.sin(func.radians(models.VehicleListing.latitude))
+    ))
+)
+
+# Matches the expression of the ix_vehicle_listings_location_point GiST index
+_LOCATION_POINT = func.point(models.VehicleListing.longitude, models.VehicleListing.latitude)
+
+# A listing is boosted by its own active boost or by an active bundle boost
+# of its owner
+_IS_BOOSTED = case(
+    (
+        exists().where(
+            and_(
+                models.UserBoost.listing_id == models.VehicleListing.id,
+                models.UserBoost.start_date <= _NOW,
+                models.UserBoost.end_date >= _NOW,
+            )
+        ) |
+        exists().where(
+            and_(
+                models.UserBoost.user_id == models.VehicleListing.user_id,
+                models.UserBoost.listing_id.is_(None), # Bundle boost
+                models.UserBoost.start_date <= _NOW,
+                models.UserBoost.end_date >= _NOW,
+            )
+        ),
+        True
+    ),
+    else_=False
+)
 
-gmaps = googlemaps.Client(key=settings.MAPS_API_KEY)
-redis_client = redis.from_url(settings.REDIS_URL, decode_responses=True)
-GEOCODE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+_MFG_DATE = func.to_date(
+    models.VehicleVerification.raw_data['reg_date'].astext,
+    'YYYY-MM-DD'
+)
 
 
 # --- Helper Functions ---
 
+def _get_boost_package_for_user(db: Session, user_id: int, package_id: int, listing_id: Optional[int]):
+    package = db.get(models.BoostPackage, package_id)
+    if not package:
+        raise HTTPException(status_code=404, detail="Boost package not found")
+    if not package.is_active:
+        raise HTTPException(status_code=400, detail="Boost package is not active")
+
+    # Validate listing for single_listing boosts
+    if package.type == 'single_listing':
+        if not listing_id:
+            raise HTTPException(status_code=400, detail="listing_id is required for this package type")
+        owns_listing = db.query(
+            exists().where(
+                models.VehicleListing.id == listing_id,
+                models.VehicleListing.user_id == user_id
+            )
+        ).scalar()
+        if not owns_listing:
+            raise HTTPException(status_code=404, detail="Listing not found or you do not own this listing")
+    return package
+
+
+def _listing_cache_key(listing_id: int) -> str:
+    return f"listing:{listing_id}"
+
+
+# The listing cache fails open: Redis errors are logged, a failed read is a
+# miss (the caller goes to the DB) and a failed write/invalidation never
+# fails a request whose DB work has already been committed
+
+def get_cached_listing(listing_id: int) -> Optional[dict]:
+    try:
+        cached = redis_client.get(_listing_cache_key(listing_id))
+    except RedisError:
+        log.warning("Listing cache read failed for listing %s", listing_id, exc_info=True)
+        return None
+    return json.loads(cached) if cached else None
+
+
+def cache_listing(listing_id: int, data: dict):
+    try:
+        redis_client.setex(
+            _listing_cache_key(listing_id), LISTING_CACHE_TTL_SECONDS, json.dumps(data))
+    except RedisError:
+        log.warning("Listing cache write failed for listing %s", listing_id, exc_info=True)
+
+
+def invalidate_listing_cache(listing_id: int):
+    try:
+        redis_client.delete(_listing_cache_key(listing_id))
+    except RedisError:
+        log.warning("Listing cache invalidation failed for listing %s", listing_id, exc_info=True)
+
 
 # --- User CRUD ---
 
 def get_user(db: Session, user_id: int):
-    return db.query(models.User).filter(models.User.id == user_id).first()
+    return db.get(models.User, user_id)
 
 
 def get_user_by_email(db: Session, email: str):
     return db.query(models.User).filter(models.User.email == email).first()
 
 
+def user_exists_by_email(db: Session, email: str) -> bool:
+    return db.query(exists().where(models.User.email == email)).scalar()
+
+
 def get_users(db: Session, skip: int = 0, limit: int = 100):
     return db.query(models.User).offset(skip).limit(limit).all()
 
@@ -80,11 +189,34 @@ def get_vehicle_listings(
     min_results: int = 10
 ):
     # Preprocess search query once outside the loop
-    if q:
-        q_clean = re.sub(r"[^a-zA-Z0-9\s]", "", q).lower().strip()
-        keywords = q_clean.split()
-    else:
-        keywords = []
+    keywords = _KW_STRIP.sub("", q).lower().split() if q else []
+
+    # Filters that don't depend on the radius are collected once and applied
+    # with a single .filter(*conds) per attempt
+    conds = [
+        # Keywords and the generated columns are both lower-cased already
+        models.VehicleVerification.manufacturer_lc.like(f"%{kw}%") |
+        models.VehicleVerification.model_lc.like(f"%{kw}%")
+        for kw in keywords
+    ]
+    if vehicle_type:
+        conds.append(models.VehicleListing.vehicle_type == vehicle_type)
+    optional_filters = (
+        (min_price, models.VehicleListing.price.__ge__),
+        (max_price, models.VehicleListing.price.__le__),
+        (min_km_driven, models.VehicleListing.kilometers_driven.__ge__),
+        (max_km_driven, models.VehicleListing.kilometers_driven.__le__),
+        (owner_id, models.VehicleListing.user_id.__eq__),
+    )
+    conds.extend(op(value) for value, op in optional_filters if value is not None)
+    # Year filter — reads the stored reg_year column
+    if min_year:
+        conds.append(models.VehicleVerification.reg_year >= min_year)
+    if max_year:
+        conds.append(models.VehicleVerification.reg_year <= max_year)
+
+    distance = _HAVERSINE_KM.label("distance")
+    is_boosted_case = _IS_BOOSTED.label("is_boosted")
 
     for radius in radii:
         # Bounding box optimization
@@ -97,131 +229,39 @@ def get_vehicle_listings(
         min_lng = lng - math.degrees(delta_lng)
         max_lng = lng + math.degrees(delta_lng)
 
-        # Haversine distance expression
-        haversine_formula = 6371 * func.acos(
-            func.greatest(-1.0, func.least(1.0, 
-                func.cos(func.radians(bindparam('lat'))) *
-                func.cos(func.radians(models.VehicleListing.latitude)) *
-                func.cos(func.radians(models.VehicleListing.longitude) - func.radians(bindparam('lng'))) +
-                func.sin(func.radians(bindparam('lat'))) *
-                func.sin(func.radians(models.VehicleListing.latitude))
-            ))
-        )
-
-        # Boost status subquery/CTE could be complex. We'll create a case statement.
-        # This determines if a listing is boosted.
-        now = datetime.utcnow()
-        is_boosted_case = case(
-            (
-                exists().where(
-                    and_(
-                        models.UserBoost.listing_id == models.VehicleListing.id,
-                        models.UserBoost.start_date <= now,
-                        models.UserBoost.end_date >= now,
-                    )
-                ) |
-                exists().where(
-                    and_(
-                        models.UserBoost.user_id == models.VehicleListing.user_id,
-                        models.UserBoost.listing_id.is_(None), # Bundle boost
-                        models.UserBoost.start_date <= now,
-                        models.UserBoost.end_date >= now,
-                    )
-                ), 
-                True
-            ),
-            else_=False
-        ).label("is_boosted")
-
-        # Base query
-        query = (
-            db.query(models.VehicleListing,
-                     haversine_formula.label("distance"),
-                     is_boosted_case)
+        results = (
+            db.query(models.VehicleListing, distance, is_boosted_case)
             .join(
                 models.VehicleVerification,
                 models.VehicleListing.reg_no == models.VehicleVerification.reg_no
             )
-            .join(
-                models.ListingImage,
-                models.VehicleListing.id == models.ListingImage.listing_id
-            )
-            .filter(models.VehicleListing.is_active.is_(True))
-            .filter(models.VehicleListing.latitude.between(min_lat, max_lat))
-            .filter(models.VehicleListing.longitude.between(min_lng, max_lng))
-            .filter(haversine_formula < radius)
-            .filter(models.ListingImage.listing_id.isnot(None))
-        )
-
-        # Text search filtering
-        if keywords:
-            search_conditions = [
-                func.lower(
-                    func.trim(
-                        models.VehicleVerification.raw_data['vehicle_manufacturer_name'].astext)
-                ).ilike(f"%{kw}%") |
-                func.lower(
-                    func.trim(
-                        models.VehicleVerification.raw_data['model'].astext)
-                ).ilike(f"%{kw}%")
-                for kw in keywords
-            ]
-            query = query.filter(and_(*search_conditions))
-
-        # Apply numeric filters only if provided
-        if vehicle_type:
-            query = query.filter(
-                models.VehicleListing.vehicle_type == vehicle_type)
-        if min_price is not None:
-            query = query.filter(models.VehicleListing.price >= min_price)
-        if max_price is not None:
-            query = query.filter(models.VehicleListing.price <= max_price)
-        if min_km_driven is not None:
-            query = query.filter(
-                models.VehicleListing.kilometers_driven >= min_km_driven)
-        if max_km_driven is not None:
-            query = query.filter(
-                models.VehicleListing.kilometers_driven <= max_km_driven)
-        if owner_id is not None:
-            query = query.filter(models.VehicleListing.user_id == owner_id)
-
-        # Year filter — calculate only if needed
-        if min_year or max_year:
-            mfg_year = cast(
-                func.substring(
-                    models.VehicleVerification.raw_data['reg_date'].astext,
-                    1,
-                    4
+            .filter(
+                models.VehicleListing.is_active,
+                _LOCATION_POINT.op('<@', is_comparison=True)(
+                    func.box(func.point(min_lng, min_lat), func.point(max_lng, max_lat))
                 ),
-                Integer
+                _HAVERSINE_KM < radius,
+                # Only listings with at least one image; EXISTS is a semi-join,
+                # so rows are not multiplied per image and need no DISTINCT
+                models.VehicleListing.images.any(),
+                *conds
             )
-            if min_year:
-                query = query.filter(mfg_year >= min_year)
-            if max_year:
-                query = query.filter(mfg_year <= max_year)
-
-        # Ordering — extract date only once
-        mfg_date = func.to_date(
-            models.VehicleVerification.raw_data['reg_date'].astext,
-            'YYYY-MM-DD'
-        )
-
-        # Final query execution
-        results = (
-            query
-            .distinct(
-                is_boosted_case,
-                haversine_formula.label("distance"),
-                mfg_date,
-                models.VehicleListing.id
+            # Populate verification from the join above rather than a
+            # separate selectin query for the same rows
+            .options(
+                contains_eager(models.VehicleListing.verification),
+                # All images / owners for the page in one IN query each,
+                # not one lazy load per row
+                selectinload(models.VehicleListing.images),
+                selectinload(models.VehicleListing.owner)
             )
             .order_by(
                 is_boosted_case.desc(), # Boosted listings first
-                haversine_formula.label("distance"),
-                mfg_date.desc(),
-                models.VehicleListing.id.desc() # Added for stable DISTINCT ON ordering
+                distance,
+                _MFG_DATE.desc(),
+                models.VehicleListing.id.desc() # Stable ordering across pages
             )
-            .params(lat=lat, lng=lng)
+            .params(lat=lat, lng=lng, now=datetime.utcnow())
             .offset(skip)
             .limit(limit)
             .all()
@@ -234,83 +274,95 @@ def get_vehicle_listings(
 
 
 def get_listing_by_id(db: Session, listing_id: int):
-    return db.query(models.VehicleListing).filter(
-        models.VehicleListing.id == listing_id,
-        models.VehicleListing.is_active == True
-    ).first()
-
-
-def get_listing_by_rc(db: Session, rc: str):
-    return db.query(models.VehicleListing).filter(models.VehicleListing.reg_no == rc).first()
+    # PK lookup goes through the identity map first. On a miss, verification
+    # (1:1) is JOINed and images (1:N) come from one follow-up IN query
+    listing = db.get(
+        models.VehicleListing,
+        listing_id,
+        options=[
+            joinedload(models.VehicleListing.verification),
+            selectinload(models.VehicleListing.images)
+        ]
+    )
+    if listing is None or not listing.is_active:
+        return None
+    return listing
 
 
-def get_active_listing_by_rc(db: Session, rc: str):
-    return db.query(models.VehicleListing).filter(models.VehicleListing.reg_no == rc, models.VehicleListing.is_active == True).first()
+def active_listing_exists_by_rc(db: Session, rc: str) -> bool:
+    return db.query(
+        exists().where(
+            models.VehicleListing.reg_no == rc,
+            models.VehicleListing.is_active
+        )
+    ).scalar()
 
 
 def get_user_vehicle_listings(
     db: Session,
     user_id: int,
     skip: int = 0,
-    limit: int = 10
+    limit: int = 10,
+    after_is_boosted: Optional[bool] = None,
+    after_created_at: Optional[datetime] = None,
+    after_id: Optional[int] = None
 ):
-    now = datetime.utcnow()
-    is_boosted_case = case(
-        (
-            exists().where(
-                and_(
-                    models.UserBoost.listing_id == models.VehicleListing.id,
-                    models.UserBoost.start_date <= now,
-                    models.UserBoost.end_date >= now,
-                )
-            ) |
-            exists().where(
-                and_(
-                    models.UserBoost.user_id == models.VehicleListing.user_id,
-                    models.UserBoost.listing_id.is_(None), # Bundle boost
-                    models.UserBoost.start_date <= now,
-                    models.UserBoost.end_date >= now,
-                )
-            ),
-            True
-        ),
-        else_=False
-    ).label("is_boosted")
+    is_boosted_case = _IS_BOOSTED.label("is_boosted")
 
-    return (
+    query = (
         db.query(models.VehicleListing, is_boosted_case)
         .filter(models.VehicleListing.user_id == user_id)
-        .filter(models.VehicleListing.is_active == True)
-        .order_by(is_boosted_case.desc(), models.VehicleListing.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+        .filter(models.VehicleListing.is_active)
+        # The response serializes images; batch them into one IN query
+        .options(selectinload(models.VehicleListing.images))
+        .order_by(
+            is_boosted_case.desc(),
+            models.VehicleListing.created_at.desc(),
+            models.VehicleListing.id.desc()
+        )
     )
 
+    if after_id is not None:
+        # Keyset pagination: resume strictly after the last row of the
+        # previous page instead of reading and discarding `skip` rows.
+        # The caller passes the whole cursor (see get_my_listings)
+        query = query.filter(
+            tuple_(
+                _IS_BOOSTED,
+                models.VehicleListing.created_at,
+                models.VehicleListing.id
+            ) < tuple_(
+                after_is_boosted,
+                after_created_at,
+                after_id
+            )
+        )
+    else:
+        query = query.offset(skip)
 
-def delete_listing(db: Session, listing_id: int, user_id: int):
-    listing = db.query(models.VehicleListing).filter(
-        models.VehicleListing.id == listing_id,
-        models.VehicleListing.user_id == user_id
-    ).first()
-
-    if listing:
-        listing.is_active = False
-        db.commit()
-        db.refresh(listing)
-        return listing
-    return None
+    return query.params(now=datetime.utcnow()).limit(limit).all()
 
 
-def update_vehicle_listing(db: Session, listing_id: int, listing_in: schemas.VehicleListingUpdate, user_id: int):
-    listing = db.query(models.VehicleListing).filter(
-        models.VehicleListing.id == listing_id,
-        models.VehicleListing.user_id == user_id
-    ).first()
+def delete_listing(db: Session, listing_id: int, user_id: int) -> bool:
+    # Ownership check and soft delete in a single UPDATE ... RETURNING id;
+    # callers only need to know whether a row was matched
+    deleted_id = db.execute(
+        update(models.VehicleListing)
+        .where(
+            models.VehicleListing.id == listing_id,
+            models.VehicleListing.user_id == user_id
+        )
+        .values(is_active=False)
+        .returning(models.VehicleListing.id)
+    ).scalar_one_or_none()
+    db.commit()
+    if deleted_id is None:
+        return False
+    invalidate_listing_cache(listing_id)
+    return True
 
-    if not listing:
-        return None
 
+def update_vehicle_listing(db: Session, listing_id: int, listing_in: schemas.VehicleListingUpdate, user_id: int):
     data = listing_in.model_dump(exclude_unset=True)
 
     if "city" in data:
@@ -321,16 +373,30 @@ def update_vehicle_listing(db: Session, listing_id: int, listing_in: schemas.Veh
         # Update usr_inp_city to match the new city
         data["usr_inp_city"] = data["city"]
 
-    for k, v in data.items():
-        setattr(listing, k, v)
+    if not data:
+        return db.query(models.VehicleListing).filter(
+            models.VehicleListing.id == listing_id,
+            models.VehicleListing.user_id == user_id
+        ).first()
 
+    # Ownership check and update in a single UPDATE ... RETURNING
+    listing = db.execute(
+        update(models.VehicleListing)
+        .where(
+            models.VehicleListing.id == listing_id,
+            models.VehicleListing.user_id == user_id
+        )
+        .values(**data)
+        .returning(models.VehicleListing)
+    ).scalar_one_or_none()
     db.commit()
-    db.refresh(listing)
+    if listing:
+        invalidate_listing_cache(listing_id)
     return listing
 
 
 def get_verification_by_reg_no(db: Session, reg_no: str):
-    return db.query(models.VehicleVerification).filter_by(reg_no=reg_no).first()
+    return db.get(models.VehicleVerification, reg_no)
 
 
 def create_verification(db: Session, reg_no: str, status: str, raw_data: dict):
@@ -343,16 +409,28 @@ def create_verification(db: Session, reg_no: str, status: str, raw_data: dict):
 
 
 def add_listing_images(db: Session, listing_id: int, images_data: List[dict]):
-    images = [
-        models.ListingImage(
-            listing_id=listing_id,
-            url=data["url"],
-            is_primary=data.get("is_primary", False)
-        )
+    rows = [
+        {
+            "listing_id": listing_id,
+            "url": data["url"],
+            "is_primary": data.get("is_primary", False)
+        }
         for data in images_data
     ]
-    db.add_all(images)
+    if not rows:
+        return []
+    # Single multi-row INSERT; RETURNING hands back the new ids so there is
+    # no per-image refresh after the commit
+    images = db.execute(
+        insert(models.ListingImage).returning(
+            models.ListingImage.id,
+            models.ListingImage.url,
+            models.ListingImage.is_primary
+        ),
+        rows
+    ).all()
     db.commit()
+    invalidate_listing_cache(listing_id)
     return images
 
 
@@ -360,12 +438,8 @@ def get_images_for_listing(db: Session, listing_id: int):
     return db.query(models.ListingImage).filter_by(listing_id=listing_id).all()
 
 
-def get_primary_image_for_listing(db: Session, listing_id: int):
-    return db.query(models.ListingImage).filter(models.ListingImage.listing_id == listing_id, models.ListingImage.is_primary == True).first()
-
-
 def get_listing_image(db: Session, image_id: int):
-    return db.query(models.ListingImage).filter_by(id=image_id).first()
+    return db.get(models.ListingImage, image_id)
 
 
 def delete_listing_image(db: Session, image_id: int):
@@ -373,6 +447,7 @@ def delete_listing_image(db: Session, image_id: int):
     if image:
         db.delete(image)
         db.commit()
+        invalidate_listing_cache(image.listing_id)
         return True
     return False
 
@@ -382,7 +457,7 @@ def update_listing_image_url(db: Session, image_id: int, new_url: str):
     if image:
         image.url = new_url
         db.commit()
-        db.refresh(image)
+        invalidate_listing_cache(image.listing_id)
         return image
     return None
 
@@ -406,6 +481,7 @@ def set_primary_image(db: Session, listing_id: int, image_id: str):
     ).update({models.ListingImage.is_primary: True})
 
     db.commit()
+    invalidate_listing_cache(listing_id)
 
 # --- Boost CRUD ---
 
@@ -416,25 +492,10 @@ def list_boost_packages(db: Session, id: Optional[int] = None, skip: int = 0, li
     return query.offset(skip).limit(limit).all()
 
 def create_user_boost(db: Session, user_id: int, boost_in: schemas.UserBoostCreate):
-    # 1. Get the package details
-    package = db.query(models.BoostPackage).filter(models.BoostPackage.id == boost_in.package_id).first()
-    if not package:
-        raise HTTPException(status_code=404, detail="Boost package not found")
-    if not package.is_active:
-        raise HTTPException(status_code=400, detail="Boost package is not active")
-
-    # 2. Validate listing for single_listing boosts
-    if package.type == 'single_listing':
-        if not boost_in.listing_id:
-            raise HTTPException(status_code=400, detail="listing_id is required for this package type")
-        listing = db.query(models.VehicleListing).filter(
-            models.VehicleListing.id == boost_in.listing_id,
-            models.VehicleListing.user_id == user_id
-        ).first()
-        if not listing:
-            raise HTTPException(status_code=404, detail="Listing not found or you do not own this listing")
+    # 1. Get the package details and validate the listing
+    package = _get_boost_package_for_user(db, user_id, boost_in.package_id, boost_in.listing_id)
 
-    # 3. Create the boost record
+    # 2. Create the boost record
     start_date = datetime.utcnow()
     end_date = start_date + timedelta(days=package.duration_days)
 
@@ -452,47 +513,27 @@ def create_user_boost(db: Session, user_id: int, boost_in: schemas.UserBoostCrea
 
 def is_listing_boosted(db: Session, listing_id: int, user_id: int) -> bool:
     now = datetime.utcnow()
-    # Check for a direct, active boost on the listing
-    direct_boost = db.query(models.UserBoost).filter(
-        models.UserBoost.listing_id == listing_id,
-        models.UserBoost.start_date <= now,
-        models.UserBoost.end_date >= now
-    ).first()
-
-    if direct_boost:
-        return True
-
-    # Check for an active bundle boost on the user
-    bundle_boost = db.query(models.UserBoost).filter(
-        models.UserBoost.user_id == user_id,
-        models.UserBoost.listing_id.is_(None), # This identifies a bundle boost
-        models.UserBoost.start_date <= now,
-        models.UserBoost.end_date >= now
-    ).first()
-
-    return bundle_boost is not None
+    # A direct boost on the listing, or an active bundle boost on the user
+    return db.query(
+        exists().where(
+            or_(
+                models.UserBoost.listing_id == listing_id,
+                and_(
+                    models.UserBoost.user_id == user_id,
+                    models.UserBoost.listing_id.is_(None), # This identifies a bundle boost
+                ),
+            ),
+            models.UserBoost.start_date <= now,
+            models.UserBoost.end_date >= now
+        )
+    ).scalar()
 
 
 async def create_boost_subscription_order(db: Session, user_id: int, boost_in: schemas.BoostSubscriptionCreate):
-    # 1. Get the package details
-    package = db.query(models.BoostPackage).filter(models.BoostPackage.id == boost_in.package_id).first()
-    if not package:
-        raise HTTPException(status_code=404, detail="Boost package not found")
-    if not package.is_active:
-        raise HTTPException(status_code=400, detail="Boost package is not active")
+    # 1. Get the package details and validate the listing
+    package = _get_boost_package_for_user(db, user_id, boost_in.package_id, boost_in.listing_id)
 
-    # 2. Validate listing for single_listing boosts
-    if package.type == 'single_listing':
-        if not boost_in.listing_id:
-            raise HTTPException(status_code=400, detail="listing_id is required for this package type")
-        listing = db.query(models.VehicleListing).filter(
-            models.VehicleListing.id == boost_in.listing_id,
-            models.VehicleListing.user_id == user_id
-        ).first()
-        if not listing:
-            raise HTTPException(status_code=404, detail="Listing not found or you do not own this listing")
-
-    # 3. Create order with payment provider
+    # 2. Create order with payment provider
     from app.payments import get_payment_driver
     payment_driver = get_payment_driver("razorpay")
     
@@ -526,15 +567,38 @@ def create_user_activity(db: Session, user_id: int, activity_type: models.UserAc
     return db_user_activity
 
 
-def create_listing_view(db: Session, listing_id: int, user_id: Optional[int] = None):
-    db_listing_view = models.ListingView(
-        listing_id=listing_id,
-        user_id=user_id
-    )
-    db.add(db_listing_view)
+def record_listing_view(listing_id: int, user_id: Optional[int] = None):
+    # One RPUSH instead of an INSERT + commit per page view; rows land on
+    # the next flush_listing_views run (at-most-once, views are analytics,
+    # so a Redis failure drops the view rather than failing the request)
+    try:
+        redis_client.rpush(LISTING_VIEWS_BUFFER_KEY, json.dumps({
+            "listing_id": listing_id,
+            "user_id": user_id,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+        }))
+    except RedisError:
+        log.warning("Dropped listing view for listing %s", listing_id, exc_info=True)
+
+
+def flush_listing_views(db: Session) -> int:
+    # LRANGE + LTRIM in one MULTI: concurrent flushers never take the same
+    # entries twice
+    pipe = redis_client.pipeline()
+    pipe.lrange(LISTING_VIEWS_BUFFER_KEY, 0, LISTING_VIEWS_FLUSH_BATCH_SIZE - 1)
+    pipe.ltrim(LISTING_VIEWS_BUFFER_KEY, LISTING_VIEWS_FLUSH_BATCH_SIZE, -1)
+    entries, _ = pipe.execute()
+    if not entries:
+        return 0
+
+    rows = []
+    for entry in entries:
+        row = json.loads(entry)
+        row["timestamp"] = datetime.fromisoformat(row["timestamp"])
+        rows.append(row)
+    db.execute(insert(models.ListingView), rows)
     db.commit()
-    db.refresh(db_listing_view)
-    return db_listing_view
+    return len(rows)
 
 
 def get_total_listing_views(db: Session, listing_id: int) -> int:
@@ -13,7 +13,11 @@ engine = create_engine(
     pool_recycle=1800,  # Recycle connections every 30 mins
 )
 
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# expire_on_commit=False: objects keep their loaded state after commit, so
+# returning them from a write path doesn't trigger a reload SELECT
+SessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, expire_on_commit=False, bind=engine
+)
 
 Base = declarative_base()
 
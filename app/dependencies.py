@@ -1,11 +1,13 @@
 from typing import Optional
+from datetime import datetime
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from app import crud, models, schemas
 from app.database import get_db
 from app.core.security import decode_access_token
+from app.core.redis import get_cached_user, cache_user
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/login")
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/v1/login", auto_error=False)  # Optional version
@@ -18,6 +20,28 @@ async def get_current_user_optional(
         return None
     return await get_current_user(db=db, token=token)
 
+async def _load_user(db: Session, email: str) -> Optional[models.User]:
+    # The cache holds the plain columns (never the password hash). A hit is
+    # attached to the session as an already-persistent row without a SELECT;
+    # anything not cached (hashed_password, relationships) lazy-loads on access
+    cached = await get_cached_user(email)
+    if cached:
+        cached["created_at"] = datetime.fromisoformat(cached["created_at"])
+        user = models.User(**cached)
+        make_transient_to_detached(user)
+        return db.merge(user, load=False)
+
+    user = crud.get_user_by_email(db, email=email)
+    if user is not None:
+        await cache_user(email, {
+            "id": user.id,
+            "email": user.email,
+            "is_active": user.is_active,
+            "is_email_verified": user.is_email_verified,
+            "created_at": user.created_at.isoformat(),
+        })
+    return user
+
 async def get_current_user(
     db: Session = Depends(get_db),
     token: str = Depends(oauth2_scheme)
@@ -35,7 +59,7 @@ async def get_current_user(
         token_data = schemas.TokenData(email=email)
     except Exception:
         raise credentials_exception
-    user = crud.get_user_by_email(db, email=token_data.email)
+    user = await _load_user(db, token_data.email)
     if user is None:
         raise credentials_exception
     if not user.is_active:
@@ -1,15 +1,12 @@
 # app/helper/email.py
+from string import Template
+
 from app.core.config import settings
 from app.core.security import create_email_verification_token, create_password_reset_token
 from .email_sender import send_email
 
-
-async def send_verification_email(email: str):
-    token = create_email_verification_token(email)
-    # verification_url = f"{settings.FRONTEND_SERVER_HOST}/api/v1/verify-email?token={token}"
-    verification_url = f"{settings.FRONTEND_SERVER_HOST}/verify-email/{token}"
-
-    html_content = f"""
+# Templates are parsed once at import; only the link is substituted per send
+_VERIFY_EMAIL_TEMPLATE = Template("""
     <html>
         <body style="margin:0; padding:0; background:#f4f6f8; font-family:Arial, sans-serif; color:#333;">
             <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="background:#f4f6f8; padding:30px 0;">
@@ -46,7 +43,7 @@ async def send_verification_email(email: str):
                     <!-- Button -->
                     <tr>
                     <td align="center" style="padding-bottom:30px;">
-                        <a href="{verification_url}"
+                        <a href="${verification_url}"
                         style="
                             display:inline-block;
                             background-color:#007BFF;
@@ -84,7 +81,27 @@ async def send_verification_email(email: str):
         </body>
     </html>
 
-    """
+    """)
+
+_RESET_PASSWORD_TEMPLATE = Template("""
+    <html>
+    <body>
+        <h2>Hello,</h2>
+        <p>You have requested to reset your password. Please click the link below to reset it:</p>
+        <a href="${reset_url}">Reset Password</a>
+        <p>This link is valid for ${expire_minutes} minutes.</p>
+        <p>If you did not request a password reset, please ignore this email.</p>
+    </body>
+    </html>
+    """)
+
+
+async def send_verification_email(email: str):
+    token = create_email_verification_token(email)
+    # verification_url = f"{settings.FRONTEND_SERVER_HOST}/api/v1/verify-email?token={token}"
+    verification_url = f"{settings.FRONTEND_SERVER_HOST}/verify-email/{token}"
+
+    html_content = _VERIFY_EMAIL_TEMPLATE.substitute(verification_url=verification_url)
 
     await send_email(email_to=email, subject="Motog - Verify Your Email", body=html_content)
 
@@ -94,16 +111,9 @@ async def send_password_reset_email(email: str):
     # reset_url = f"{settings.FRONTEND_SERVER_HOST}/api/v1/reset-password?token={token}"
     reset_url = f"{settings.FRONTEND_SERVER_HOST}/reset-password/{token}"
 
-    html_content = f"""
-    <html>
-    <body>
-        <h2>Hello,</h2>
-        <p>You have requested to reset your password. Please click the link below to reset it:</p>
-        <a href="{reset_url}">Reset Password</a>
-        <p>This link is valid for {settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES} minutes.</p>
-        <p>If you did not request a password reset, please ignore this email.</p>
-    </body>
-    </html>
-    """
+    html_content = _RESET_PASSWORD_TEMPLATE.substitute(
+        reset_url=reset_url,
+        expire_minutes=settings.PASSWORD_RESET_TOKEN_EXPIRE_MINUTES
+    )
 
     await send_email(email_to=email, subject="Password Reset Request", body=html_content)
@@ -1,12 +1,31 @@
 # app/helper/email_sender.py
+import logging
 import httpx
 from fastapi import HTTPException, status
 from app.core.config import settings
+from app.core.redis import get_redis_client
 
-async def _get_zoho_access_token() -> str:
+log = logging.getLogger(__name__)
+
+ZOHO_TOKEN_CACHE_KEY = "zoho:access_token"
+# Zoho access tokens live for an hour; drop ours a few minutes early
+ZOHO_TOKEN_TTL_SECONDS = 55 * 60
+
+# Shared client: one connection pool / TLS session for all Zoho calls.
+# Closed in the app lifespan
+http_client = httpx.AsyncClient(timeout=10.0)
+
+async def _get_zoho_access_token(force_refresh: bool = False) -> str:
     """
-    Generates a new Zoho access token using the refresh token.
+    Returns a cached Zoho access token, refreshing it with the refresh token
+    when missing, expired or force_refresh is set.
     """
+    redis_client = await get_redis_client()
+    if not force_refresh:
+        cached_token = await redis_client.get(ZOHO_TOKEN_CACHE_KEY)
+        if cached_token:
+            return cached_token.decode()
+
     if not all([settings.ZOHO_MAIL_CLIENT_ID, settings.ZOHO_MAIL_CLIENT_SECRET, settings.ZOHO_MAIL_REFRESH_TOKEN, settings.ZOHO_MAIL_REGION]):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Zoho Mail is not configured.")
 
@@ -18,21 +37,25 @@ async def _get_zoho_access_token() -> str:
         "grant_type": "refresh_token",
     }
 
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.post(token_url, data=data)
-            response.raise_for_status()
-            token_data = response.json()
-            if "access_token" not in token_data:
-                raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve Zoho access token.")
-            return token_data["access_token"]
-        except httpx.HTTPStatusError as e:
-            # Log the error details for debugging
-            print(f"Error refreshing Zoho token: {e.response.text}")
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not refresh Zoho authentication token.")
-        except Exception as e:
-            print(f"An unexpected error occurred while refreshing token: {e}")
-            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred.")
+    try:
+        response = await http_client.post(token_url, data=data)
+        response.raise_for_status()
+        token_data = response.json()
+        if "access_token" not in token_data:
+            raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to retrieve Zoho access token.")
+    except HTTPException:
+        raise
+    except httpx.HTTPStatusError as e:
+        # Log the error details for debugging
+        log.error("Error refreshing Zoho token: %s", e.response.text)
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Could not refresh Zoho authentication token.")
+    except Exception as e:
+        log.exception("An unexpected error occurred while refreshing token")
+        raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred.")
+
+    access_token = token_data["access_token"]
+    await redis_client.setex(ZOHO_TOKEN_CACHE_KEY, ZOHO_TOKEN_TTL_SECONDS, access_token)
+    return access_token
 
 
 async def send_email(email_to: str, subject: str, body: str):
@@ -43,15 +66,8 @@ async def send_email(email_to: str, subject: str, body: str):
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Zoho Account ID is not configured.")
 
     try:
-        access_token = await _get_zoho_access_token()
-        
         api_url = f"https://mail.zoho.{settings.ZOHO_MAIL_REGION}/api/accounts/{settings.ZOHO_MAIL_ACCOUNT_ID}/messages"
-        
-        headers = {
-            "Authorization": f"Zoho-oauthtoken {access_token}",
-            "Content-Type": "application/json",
-        }
-        
+
         json_payload = {
             "fromAddress": settings.SMTP_FROM_EMAIL,
             "toAddress": email_to,
@@ -60,17 +76,25 @@ async def send_email(email_to: str, subject: str, body: str):
             "askReceipt": "no" # Or "yes" if you want read receipts
         }
 
-        async with httpx.AsyncClient() as client:
-            response = await client.post(api_url, headers=headers, json=json_payload)
-            response.raise_for_status()
+        for attempt in range(2):
+            # A 401 means the cached token was revoked early: refresh once and retry
+            access_token = await _get_zoho_access_token(force_refresh=attempt > 0)
+            headers = {
+                "Authorization": f"Zoho-oauthtoken {access_token}",
+                "Content-Type": "application/json",
+            }
+            response = await http_client.post(api_url, headers=headers, json=json_payload)
+            if response.status_code != status.HTTP_401_UNAUTHORIZED:
+                break
+        response.raise_for_status()
 
     except HTTPException as e:
         # Re-raise HTTPExceptions from _get_zoho_access_token
         raise e
     except httpx.HTTPStatusError as e:
         # Log the error for debugging
-        print(f"Error sending email via Zoho: {e.response.text}")
+        log.error("Error sending email via Zoho: %s", e.response.text)
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="Failed to send email.")
     except Exception as e:
-        print(f"An unexpected error occurred while sending email: {e}")
+        log.exception("An unexpected error occurred while sending email")
         raise HTTPException(status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, detail="An unexpected error occurred while sending email.")
\ No newline at end of file
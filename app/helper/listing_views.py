@@ -0,0 +1,36 @@
+# app/helper/listing_views.py
+import asyncio
+import logging
+
+from fastapi.concurrency import run_in_threadpool
+
+from app import crud
+from app.database import SessionLocal
+
+log = logging.getLogger(__name__)
+
+LISTING_VIEWS_FLUSH_INTERVAL_SECONDS = 2
+
+
+def flush_buffered_views() -> int:
+    """
+    Drains the Redis view buffer into listing_views, one multi-row INSERT
+    per batch. Returns the number of rows written.
+    """
+    db = SessionLocal()
+    try:
+        total = 0
+        while flushed := crud.flush_listing_views(db):
+            total += flushed
+        return total
+    finally:
+        db.close()
+
+
+async def flush_listing_views_periodically():
+    while True:
+        await asyncio.sleep(LISTING_VIEWS_FLUSH_INTERVAL_SECONDS)
+        try:
+            await run_in_threadpool(flush_buffered_views)
+        except Exception:
+            log.exception("Error flushing buffered listing views")
@@ -1,7 +1,53 @@
-import requests
+import asyncio
+from operator import itemgetter
+from typing import Optional
+import httpx
+import orjson
 from app.core.config import settings
+from app.core.redis import get_redis_client
 
-def get_place_details(place_id: str):
+GEOCODE_URL = "https://maps.googleapis.com/maps/api/geocode/json"
+REVERSE_GEOCODE_RESULT_TYPES = "sublocality|locality|administrative_area_level_7|administrative_area_level_6|administrative_area_level_5|administrative_area_level_4|administrative_area_level_3|administrative_area_level_2|administrative_area_level_1|country"
+
+# Shared async client so Google calls reuse pooled connections; closed in
+# the app lifespan
+http_client = httpx.AsyncClient(
+    timeout=5.0,
+    limits=httpx.Limits(max_keepalive_connections=32)
+)
+
+# Place details barely change; cache Google's raw response for a day
+PLACE_DETAILS_CACHE_TTL_SECONDS = 24 * 60 * 60
+PLACE_DETAILS_LANGUAGE = "en"
+# Unknown place ids are remembered (shorter) so repeats don't hit Google
+PLACE_NOT_FOUND_MARKER = b"\x00"
+PLACE_NOT_FOUND_CACHE_TTL_SECONDS = 60 * 60
+
+# Rate limiting / transient upstream failures are retried with backoff
+PLACES_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+PLACES_MAX_ATTEMPTS = 3
+PLACES_RETRY_BASE_DELAY_SECONDS = 0.2
+
+# Geocode component types usable as the main text, most preferred first
+_MAIN_TEXT_PRIORITY = {
+    component_type: rank for rank, component_type in enumerate((
+        "locality", "sublocality", "administrative_area_level_7", "administrative_area_level_6",
+        "administrative_area_level_5", "administrative_area_level_4", "administrative_area_level_3",
+        "administrative_area_level_2"
+    ))
+}
+
+# Autocomplete suggestion types worth showing as a city/area pick
+_RELEVANT_SUGGESTION_TYPES = frozenset({"sublocality", "locality"})
+_get_place_prediction = itemgetter("placePrediction")
+
+def _place_details_cache_key(place_id: str) -> str:
+    return f"places:v1:{place_id}:{PLACE_DETAILS_LANGUAGE}"
+
+async def _fetch_place_details(place_id: str) -> Optional[bytes]:
+    """
+    Raw Places details response, or None for an unknown place_id (404).
+    """
     url = f"https://places.googleapis.com/v1/places/{place_id}"
     headers = {
         "Content-Type": "application/json",
@@ -9,11 +55,42 @@ def get_place_details(place_id: str):
         "X-Goog-FieldMask": "id,displayName,formattedAddress,addressComponents,location"
     }
     params = {
-        "languageCode": "en" # Optional: Specify language
+        "languageCode": PLACE_DETAILS_LANGUAGE
     }
-    response = requests.get(url, headers=headers, params=params)
+    for attempt in range(PLACES_MAX_ATTEMPTS):
+        if attempt:
+            await asyncio.sleep(PLACES_RETRY_BASE_DELAY_SECONDS * 2 ** (attempt - 1))
+        response = await http_client.get(url, headers=headers, params=params)
+        if response.status_code not in PLACES_RETRY_STATUSES:
+            break
+    if response.status_code == 404:
+        return None
+    response.raise_for_status() # Will raise an exception for other 4XX/5XX errors
+    return response.content
+
+async def get_place_details(place_id: str) -> Optional[dict]:
+    redis_client = await get_redis_client()
+    cache_key = _place_details_cache_key(place_id)
+    raw = await redis_client.get(cache_key)
+    if raw is None:
+        raw = await _fetch_place_details(place_id)
+        if raw is None:
+            await redis_client.setex(cache_key, PLACE_NOT_FOUND_CACHE_TTL_SECONDS, PLACE_NOT_FOUND_MARKER)
+            return None
+        await redis_client.setex(cache_key, PLACE_DETAILS_CACHE_TTL_SECONDS, raw)
+    elif raw == PLACE_NOT_FOUND_MARKER:
+        return None
+    return orjson.loads(raw)
+
+async def reverse_geocode(lat: float, lng: float):
+    params = {
+        "latlng": f"{lat},{lng}",
+        "result_type": REVERSE_GEOCODE_RESULT_TYPES,
+        "key": settings.MAPS_API_KEY
+    }
+    response = await http_client.get(GEOCODE_URL, params=params)
     response.raise_for_status() # Will raise an exception for 4XX/5XX errors
-    return response.json()
+    return orjson.loads(response.content)
 
 def extract_location_components(response, source_api):
     addr = {"mainText": "", "secondaryText": None, "state": "", "country": "", "lat": None, "lng": None, "placeId": None}
@@ -37,40 +114,40 @@ def extract_location_components(response, source_api):
         addr['lng'] = result.get('geometry', {}).get('location', {}).get('lng')
         addr['placeId'] = result.get('place_id')
 
-        # Geocode specific logic to find main text
-        types_to_check = [
-            "locality", "sublocality", "administrative_area_level_7", "administrative_area_level_6",
-            "administrative_area_level_5", "administrative_area_level_4", "administrative_area_level_3",
-            "administrative_area_level_2"
-        ]
-        for component_type in types_to_check:
-            for component in addr_comp:
-                if component_type in component.get('types', []):
-                    addr['mainText'] = component.get('long_name', '')
-                    break
-            if addr['mainText']:
-                break
-
-    # Common logic for state and country
+    # Single pass: state and country, plus (for geocode) the name of the
+    # first component of each main-text type, keyed by its priority rank
+    main_text_by_rank = {}
     for component in addr_comp:
-        if "administrative_area_level_1" in component.get('types', []):
-            addr['state'] = component.get('long_name', '')
-        if "country" in component.get('types', []):
-            addr['country'] = component.get('long_name', '')
+        name = component.get('long_name', '')
+        for component_type in component.get('types', []):
+            rank = _MAIN_TEXT_PRIORITY.get(component_type)
+            if rank is not None:
+                main_text_by_rank.setdefault(rank, name)
+            if component_type == "administrative_area_level_1":
+                addr['state'] = name
+            if component_type == "country":
+                addr['country'] = name
+
+    if source_api == "geocode":
+        # Geocode specific logic to find main text: highest-priority type
+        # whose first matching component has a name
+        addr['mainText'] = next(
+            (main_text_by_rank[rank] for rank in sorted(main_text_by_rank) if main_text_by_rank[rank]),
+            ''
+        )
 
     return addr
 
 
 def filter_relevant_suggestions(suggestions):
-    relevant_types = {"sublocality", "locality"}
-
     filtered = []
-    for s in suggestions:
-        types = s["placePrediction"].get("types", [])
-        if any(t in relevant_types for t in types):
-            filtered.append({
-                "placeId": s["placePrediction"]["placeId"],
-                "mainText": s["placePrediction"]["structuredFormat"]["mainText"]["text"],
-                "secondaryText": s["placePrediction"]["structuredFormat"]["secondaryText"]["text"]
+    append = filtered.append
+    for prediction in map(_get_place_prediction, suggestions):
+        if not _RELEVANT_SUGGESTION_TYPES.isdisjoint(prediction.get("types", ())):
+            structured = prediction["structuredFormat"]
+            append({
+                "placeId": prediction["placeId"],
+                "mainText": structured["mainText"]["text"],
+                "secondaryText": structured["secondaryText"]["text"]
             })
     return filtered
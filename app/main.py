@@ -1,21 +1,54 @@
 # backend/app/main.py
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from app.database import engine, Base
 from app.apis.v1.api import api_router
 from app.core.config import settings
+from app.core.logger import setup_logging, log_listener
+from app.helper.locationServices import http_client as maps_http_client
+from app.helper.email_sender import http_client as email_http_client
+from app.helper.listing_views import flush_buffered_views, flush_listing_views_periodically
 
-# Create database tables
-print("Attempting to create database tables...")
-try:
-    Base.metadata.create_all(bind=engine)
-    print("Database tables should be created if they didn't exist.")
-except Exception as e:
-    print(f"Error creating database tables: {e}")
+setup_logging()
+log = logging.getLogger(__name__)
+
+# Create database tables for local/dev runs; prod schema is owned by the
+# Alembic migrations start.sh runs, so workers skip the round-trip there
+if settings.ENV != 'prod':
+    log.info("Attempting to create database tables...")
+    try:
+        Base.metadata.create_all(bind=engine)
+        log.info("Database tables should be created if they didn't exist.")
+    except Exception:
+        log.exception("Error creating database tables")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    view_flusher = asyncio.create_task(flush_listing_views_periodically())
+    yield
+    view_flusher.cancel()
+    with suppress(asyncio.CancelledError):
+        await view_flusher
+    # Write out whatever was buffered since the last tick
+    try:
+        await run_in_threadpool(flush_buffered_views)
+    except Exception:
+        log.exception("Error flushing buffered listing views on shutdown")
+    await maps_http_client.aclose()
+    await email_http_client.aclose()
+    log_listener.stop()
 
 fastapi_kwargs = {
     "title": settings.PROJECT_NAME,
-    "version": "0.1.0"
+    "version": "0.1.0",
+    "lifespan": lifespan,
+    # orjson renders the encoded response bodies in C
+    "default_response_class": ORJSONResponse
 }
 
 if settings.ENV == 'prod':
@@ -26,18 +59,16 @@ if settings.ENV == 'prod':
 app = FastAPI(**fastapi_kwargs)
 
 # CORS Middleware configuration
-if settings.ENV == 'nonprod':
-    origins = [
+_ORIGINS_BY_ENV: dict[str, tuple[str, ...]] = {
+    "nonprod": (
         "http://localhost",
         "http://localhost:3000",  # Your Next.js frontend origin
         "http://127.0.0.1:3000",  # Another common local development address
         "http://192.168.1.3:3000",
         "https://motog-app-fe.vercel.app",
         "https://www.gomotog.com",
-        "*",
-    ]
-elif settings.ENV == 'prod':
-    origins = [
+    ),
+    "prod": (
         "https://www.gomotog.com",
         "https://motog-app-fe-liart.vercel.app",
         "https://motog-app-fe.vercel.app",
@@ -45,16 +76,14 @@ elif settings.ENV == 'prod':
         "http://localhost:3000",  # Your Next.js frontend origin
         "http://127.0.0.1:3000",  # Another common local development address
         "http://192.168.1.3:3000",
-
-    ]
-else:
-    origins = []
+    ),
+}
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=origins,
+    allow_origins=list(_ORIGINS_BY_ENV.get(settings.ENV, ())),
     allow_credentials=True,
-    allow_methods=["*"],
+    allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
     allow_headers=["*"],
 )
 
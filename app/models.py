@@ -10,6 +10,8 @@ from sqlalchemy import (
     Enum,
     Numeric,
     Index,
+    Computed,
+    CheckConstraint,
 )
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
@@ -43,7 +45,10 @@ class VehicleListing(Base):
     __tablename__ = "vehicle_listings"
 
     id = Column(Integer, primary_key=True, index=True)
-    vehicle_type = Column(Enum(VehicleTypeEnum), index=True)
+    # Plain string + CHECK rather than a Postgres ENUM type, so adding a type
+    # is a constraint swap instead of an ALTER TYPE. Filtered through
+    # listings_filter_cover, which leads with vehicle_type
+    vehicle_type = Column(String(8))
     kilometers_driven = Column(Integer)
     price = Column(Integer)
     usr_inp_city = Column(String, index=True)
@@ -59,12 +64,16 @@ class VehicleListing(Base):
     owner = relationship("User", back_populates="listings")
 
     reg_no = Column(String, ForeignKey("vehicle_verifications.reg_no"), nullable=False)
+    # selectin: relationship loads arrive as one IN query per page instead of
+    # widening every listing row with the verification JSONB / image rows.
+    # Queries that already join verification use contains_eager/joinedload
     verification = relationship(
-        "VehicleVerification", back_populates="listing", lazy="joined"
+        "VehicleVerification", back_populates="listing", lazy="selectin"
     )
 
     images = relationship(
-        "ListingImage", back_populates="listing", cascade="all, delete-orphan"
+        "ListingImage", back_populates="listing", cascade="all, delete-orphan",
+        lazy="selectin"
     )
     boosts = relationship("UserBoost", back_populates="listing")
     views = relationship("ListingView", back_populates="listing")
@@ -73,11 +82,40 @@ class VehicleListing(Base):
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     __table_args__ = (
+        CheckConstraint(
+            "vehicle_type IN ({})".format(", ".join(f"'{t.value}'" for t in VehicleTypeEnum)),
+            name='ck_vehicle_listings_vehicle_type'
+        ),
+        # R-tree over the (lng, lat) point; serves the feed's bounding-box
+        # "point <@ box" filter
+        Index(
+            'ix_vehicle_listings_location_point',
+            func.point(longitude, latitude),
+            postgresql_using='gist',
+            postgresql_where=is_active == True
+        ),
+        # Partial indexes: soft-deleted rows never enter the index
+        Index(
+            'listings_active_user',
+            user_id,
+            created_at.desc(),
+            postgresql_where=is_active == True
+        ),
+        Index(
+            'listings_active_id',
+            id,
+            postgresql_where=is_active == True
+        ),
+        # Covering index for the feed filters (type / price / km driven)
         Index(
-            'idx_vehicle_listings_location',
-            'latitude',
-            'longitude',
-            postgresql_using='gist'
+            'listings_filter_cover',
+            vehicle_type,
+            price,
+            kilometers_driven,
+            postgresql_include=[
+                'id', 'user_id', 'reg_no', 'latitude', 'longitude', 'created_at'
+            ],
+            postgresql_where=is_active == True
         ),
     )
 
@@ -90,11 +128,46 @@ class VehicleVerification(Base):
     raw_data = Column(JSONB)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
+    # Search fields extracted from raw_data once, on write
+    manufacturer_lc = Column(
+        String,
+        Computed("lower(trim(raw_data->>'vehicle_manufacturer_name'))", persisted=True)
+    )
+    model_lc = Column(
+        String,
+        Computed("lower(trim(raw_data->>'model'))", persisted=True)
+    )
+    reg_year = Column(
+        Integer,
+        Computed(
+            "CASE WHEN raw_data->>'reg_date' ~ '^[0-9]{4}' "
+            "THEN substring(raw_data->>'reg_date', 1, 4)::integer END",
+            persisted=True
+        )
+    )
+
     # define relationship to Vehicle Listing
     listing = relationship(
         "VehicleListing", back_populates="verification", uselist=False
     )
 
+    __table_args__ = (
+        # Trigram indexes serve the '%keyword%' search (needs pg_trgm)
+        Index(
+            'ix_vehicle_verifications_manufacturer_lc_trgm',
+            manufacturer_lc,
+            postgresql_using='gin',
+            postgresql_ops={'manufacturer_lc': 'gin_trgm_ops'}
+        ),
+        Index(
+            'ix_vehicle_verifications_model_lc_trgm',
+            model_lc,
+            postgresql_using='gin',
+            postgresql_ops={'model_lc': 'gin_trgm_ops'}
+        ),
+        Index('ix_vehicle_verifications_reg_year', reg_year),
+    )
+
 
 class ListingImage(Base):
     __tablename__ = "listing_images"
@@ -106,6 +179,11 @@ class ListingImage(Base):
 
     listing = relationship("VehicleListing", back_populates="images")
 
+    __table_args__ = (
+        # Feed join on listing_id and the primary-image lookups
+        Index('ix_listing_images_listing_primary', listing_id, is_primary),
+    )
+
 
 class BoostPackage(Base):
     __tablename__ = "boost_packages"
@@ -138,6 +216,18 @@ class UserBoost(Base):
     package = relationship("BoostPackage", back_populates="user_boosts")
     listing = relationship("VehicleListing", back_populates="boosts")
 
+    __table_args__ = (
+        # Serve the "active boost" probes (direct listing boost / bundle boost)
+        Index('ix_user_boosts_listing_period', listing_id, end_date, start_date),
+        Index(
+            'ix_user_boosts_bundle_period',
+            user_id,
+            end_date,
+            start_date,
+            postgresql_where=listing_id.is_(None)
+        ),
+    )
+
 
 class UserActivityTypeEnum(str, enum.Enum):
     login = "login"
@@ -165,4 +255,9 @@ class ListingView(Base):
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
 
     listing = relationship("VehicleListing", back_populates="views")
-    user = relationship("User", back_populates="views")
\ No newline at end of file
+    user = relationship("User", back_populates="views")
+
+    __table_args__ = (
+        # Per-listing view counts, total and over a recent window
+        Index('ix_listing_views_listing_timestamp', listing_id, timestamp),
+    )
@@ -1,18 +1,49 @@
 # app/schemas.py
-from pydantic import BaseModel, EmailStr, Field
-from typing import Optional, List, Any
-from datetime import datetime, date
+import json
+from pydantic import BaseModel, ConfigDict, Field, StringConstraints, AfterValidator, BeforeValidator, TypeAdapter
+from pydantic.dataclasses import dataclass
+from typing import Optional, List, Any, Annotated, Literal
+from datetime import datetime
 from .models import VehicleTypeEnum  # Import from your models
-from fastapi import UploadFile, File
+
+def _lowercase_email_domain(email: str) -> str:
+    local, _, domain = email.rpartition("@")
+    return f"{local}@{domain.lower()}"
+
+
+# Request emails: a compiled-pattern syntax check instead of EmailStr's full
+# email-validator parse on every register/resend/forgot-password call. The
+# domain is lowercased, as EmailStr's normalization did
+EmailAnnot = Annotated[
+    str,
+    StringConstraints(
+        strip_whitespace=True, max_length=254, pattern=r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
+    ),
+    AfterValidator(_lowercase_email_domain),
+]
+
+# Validated as a Literal (pydantic-core matches the strings directly) rather
+# than constructing the Enum per value; members come from the model enum
+VehicleTypeLiteral = Literal[tuple(t.value for t in VehicleTypeEnum)]
+
+# Listing input formats, checked by pydantic-core's compiled regex. Reg
+# numbers are upper-cased to match the stored verification keys; RC
+# verification and listing creation share RegNo so both accept the same keys
+RegNo = Annotated[
+    str,
+    StringConstraints(strip_whitespace=True, to_upper=True, pattern=r"^[A-Za-z0-9]{7,10}$"),
+]
+Phone = Annotated[str, StringConstraints(strip_whitespace=True, pattern=r"^\+?\d{10,15}$")]
 
 # --- User Schemas ---
 
 
 class UserBase(BaseModel):
-    email: EmailStr
+    email: str
 
 
 class UserCreate(UserBase):
+    email: EmailAnnot
     password: str = Field(..., min_length=8)
 
 
@@ -22,18 +53,24 @@ class User(UserBase):
     is_email_verified: bool
     created_at: datetime
 
-    class Config:
-        from_attributes = True  # Pydantic V2 (was orm_mode = True in V1)
+    model_config = ConfigDict(from_attributes=True)
 
 # --- Token Schemas (for JWT) ---
 
 
+# Outbound-only response models are frozen: built once, serialized, never
+# assigned to afterwards
 class Token(BaseModel):
     access_token: str
     token_type: str
 
+    model_config = ConfigDict(frozen=True)
+
 
-class TokenData(BaseModel):
+# Internal / request-only payloads are slotted pydantic dataclasses: still
+# validated, but built and dropped per request without a per-instance __dict__
+@dataclass(slots=True)
+class TokenData:
     email: Optional[str] = None
 
 
@@ -51,35 +88,31 @@ class ListingImage(BaseModel):
     url: str
     is_primary: bool = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 # --- Vehicle Listing Schemas ---
 
 
-class VehicleListingBase(BaseModel):
-    vehicle_type: VehicleTypeEnum
-    reg_no: str = Field(..., min_length=7, max_length=10)
+class VehicleListingCore(BaseModel):
+    # Fields shared by the listing input and response schemas
+    vehicle_type: VehicleTypeLiteral
     kilometers_driven: int = Field(..., ge=0)
     price: int = Field(..., gt=0)
-    usr_inp_city: str = Field(..., min_length=2)
     city: str = Field(..., min_length=2)
     latitude: float
     longitude: float
-    seller_phone: str = Field(..., min_length=10, max_length=15)
     description: Optional[str] = None
 
 
-class VehicleListingCreate(BaseModel):
-    vehicle_type: VehicleTypeEnum
-    reg_no: str = Field(..., example="HJ01ME5678", min_length=7, max_length=10)
-    kilometers_driven: int = Field(..., ge=0)
-    price: int = Field(..., gt=0)
-    city: str = Field(..., min_length=2)
-    latitude: float
-    longitude: float
+class VehicleListingBase(VehicleListingCore):
+    reg_no: str = Field(..., min_length=7, max_length=10)
+    usr_inp_city: str = Field(..., min_length=2)
     seller_phone: str = Field(..., min_length=10, max_length=15)
-    description: Optional[str] = None
+
+
+class VehicleListingCreate(VehicleListingCore):
+    reg_no: RegNo = Field(..., example="HJ01ME5678")
+    seller_phone: Phone
 
 
 class VehicleListingUpdate(BaseModel):
@@ -88,27 +121,80 @@ class VehicleListingUpdate(BaseModel):
     city: Optional[str] = Field(None, min_length=2)
     latitude: Optional[float] = None
     longitude: Optional[float] = None
-    seller_phone: Optional[str] = Field(None, min_length=10, max_length=15)
+    seller_phone: Optional[Phone] = None
     description: Optional[str] = Field(None, min_length=1, max_length=250)
 
 
+def _rc_value_as_text(value: Any) -> Any:
+    # The upstream RC API is not strict about types (numeric dates/statuses,
+    # nested objects); render non-strings as their JSON text
+    if value is None or isinstance(value, str):
+        return value
+    return json.dumps(value)
+
+RCText = Annotated[Optional[str], BeforeValidator(_rc_value_as_text)]
+
+
+class RCDetails(BaseModel):
+    # Stored RC verification payload. The fields listings read are typed so
+    # they get a static serializer; everything else passes through as extra
+    vehicle_manufacturer_name: RCText = None
+    model: RCText = None
+    reg_date: RCText = None
+    vehicle_colour: RCText = None
+    body_type: RCText = None
+    rc_status: RCText = None
+
+    model_config = ConfigDict(extra="allow")
+
+
 class VehicleListing(VehicleListingBase):
     id: int
     user_id: int
     is_active: bool
     created_at: datetime
-    owner_email: Optional[EmailStr] = None
-    rc_details: Optional[Any] = None
-    images: List[ListingImage] = []
+    owner_email: Optional[str] = None
+    rc_details: Optional[RCDetails] = None
+    images: List[ListingImage] = Field(default_factory=list)
     distance: Optional[float] = None
     is_boosted: Optional[bool] = False
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class RCRequest(BaseModel):
-    reg_no: str
+class MyListingsCursor(BaseModel):
+    # The last row's sort key; sent back as-is as the next page's query params
+    after_is_boosted: bool
+    after_created_at: datetime
+    after_id: int
+
+
+class MyListingsPage(BaseModel):
+    listings: List[VehicleListing]
+    next_cursor: Optional[MyListingsCursor] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class VehicleListingSummary(VehicleListingCore):
+    # Feed rows: the primary image URL instead of the image list, and no
+    # reg_no / seller_phone / rc_details / owner_email. The feed is public and
+    # cached, so it carries nothing GET /listings/{id} would mask
+    id: int
+    user_id: int
+    is_active: bool
+    created_at: datetime
+    usr_inp_city: str
+    primary_image_url: Optional[str] = None
+    distance: Optional[float] = None
+    is_boosted: Optional[bool] = False
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+@dataclass(slots=True)
+class RCRequest:
+    reg_no: RegNo
 
 
 class VehicleVerificationResponse(BaseModel):
@@ -116,6 +202,8 @@ class VehicleVerificationResponse(BaseModel):
     status: str
     data: dict
 
+    model_config = ConfigDict(frozen=True)
+
 
 class LocationRequest(BaseModel):
     lat: Optional[str] = Field(None, example="24.5164769", description="Latitude of the Location")
@@ -132,6 +220,8 @@ class LocationDetail(BaseModel):
     lng: float
     placeId: Optional[str] = None
 
+    model_config = ConfigDict(frozen=True)
+
 
 
 
@@ -158,17 +248,19 @@ class LocationSuggestion(BaseModel):
     secondaryText: str = Field(...,
                                description="Additional context for the prediction")
 
+    model_config = ConfigDict(frozen=True)
+
 
 class LocAutoCompleteResponse(BaseModel):
     suggestions: List[LocationSuggestion]
 
 
 class ResendEmailRequest(BaseModel):
-    email: EmailStr
+    email: EmailAnnot
 
 
 class ForgotPasswordRequest(BaseModel):
-    email: EmailStr
+    email: EmailAnnot
 
 
 class ResetPasswordRequest(BaseModel):
@@ -197,8 +289,7 @@ class BoostPackage(BoostPackageBase):
     id: int
     is_active: bool
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
 class UserBoostBase(BaseModel):
     package_id: int
@@ -213,11 +304,11 @@ class UserBoost(UserBoostBase):
     start_date: datetime
     end_date: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
-class BoostSubscriptionCreate(BaseModel):
+@dataclass(slots=True)
+class BoostSubscriptionCreate:
     package_id: int
     listing_id: Optional[int] = None
 
@@ -232,7 +323,8 @@ class BoostSubscriptionResponse(BaseModel):
     prefill: dict
 
 
-class BoostPaymentVerification(BaseModel):
+@dataclass(slots=True)
+class BoostPaymentVerification:
     razorpay_payment_id: str
     razorpay_order_id: str
     razorpay_signature: str
@@ -252,8 +344,11 @@ class UserActivityBase(BaseModel):
     details: Optional[dict] = None
 
 
-class UserActivityCreate(UserActivityBase):
+@dataclass(slots=True)
+class UserActivityCreate:
+    activity_type: str
     user_id: int
+    details: Optional[dict] = None
 
 
 class UserActivity(UserActivityBase):
@@ -261,8 +356,7 @@ class UserActivity(UserActivityBase):
     user_id: int
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ListingViewBase(BaseModel):
@@ -270,20 +364,30 @@ class ListingViewBase(BaseModel):
     user_id: Optional[int] = None
 
 
-class ListingViewCreate(ListingViewBase):
-    pass
+@dataclass(slots=True)
+class ListingViewCreate:
+    listing_id: int
+    user_id: Optional[int] = None
 
 
 class ListingView(ListingViewBase):
     id: int
     timestamp: datetime
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 class ListingStats(BaseModel):
     total_views: int
     views_last_7_days: int
     today_views: int
-    views_last_30_days: int
\ No newline at end of file
+    views_last_30_days: int
+
+
+# --- List adapters ---
+# Built once at import: endpoints that hand back lists validate/serialize the
+# whole list through one compiled schema instead of per-row model calls
+
+VehicleListingListAdapter = TypeAdapter(List[VehicleListing])
+VehicleListingSummaryListAdapter = TypeAdapter(List[VehicleListingSummary])
+ListingImageListAdapter = TypeAdapter(List[ListingImage])
@@ -5,6 +5,15 @@ set -o errexit
 # Update and install libmagic
 apt-get update && apt-get install -y libmagic1 libheif1 libheif-examples
 
+# Refuse to boot on an old pydantic or a non-compiled pydantic-core build
+python -c "
+import pydantic
+from packaging.version import Version
+from pydantic_core import _pydantic_core
+assert Version(pydantic.VERSION) >= Version('2.11'), 'pydantic ' + pydantic.VERSION + ' < 2.11'
+assert _pydantic_core.__file__.endswith(('.so', '.pyd')), 'pydantic-core is not a compiled build'
+"
+
 # Run database migrations
 alembic upgrade head
 